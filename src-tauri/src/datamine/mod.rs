@@ -126,6 +126,12 @@ impl Datamine {
                 log::info!("[Datamine] ✅ Found in registry: {:?}", path);
                 return Some(path);
             }
+            
+            log::debug!("[Datamine] Checking Steam library folders...");
+            if let Some(path) = Self::find_from_steam_libraries() {
+                log::info!("[Datamine] ✅ Found in Steam library: {:?}", path);
+                return Some(path);
+            }
         }
         
         // 2. Common Steam paths (multiple drives + folder variants)
@@ -196,6 +202,7 @@ impl Datamine {
         log::error!("[Datamine] ❌ War Thunder not found in any known location");
         log::error!("[Datamine] Checked:");
         log::error!("[Datamine]   - Windows Registry (4 keys)");
+        log::error!("[Datamine]   - Steam library folders (libraryfolders.vdf)");
         log::error!("[Datamine]   - {} Steam paths", steam_paths.len());
         log::error!("[Datamine]   - {} Standalone paths", standalone_paths.len());
         None
@@ -258,6 +265,101 @@ impl Datamine {
         log::trace!("[Datamine]   No valid paths found in registry");
         None
     }
+    
+    /// Look up War Thunder via Steam's own library list instead of probing drives
+    #[cfg(target_os = "windows")]
+    fn find_from_steam_libraries() -> Option<PathBuf> {
+        use winreg::enums::*;
+        use winreg::RegKey;
+        
+        let hkcu = RegKey::predef(HKEY_CURRENT_USER);
+        let steam_root = hkcu.open_subkey(r"Software\Valve\Steam")
+            .and_then(|key| key.get_value::<String, _>("SteamPath"))
+            .ok()?;
+        let steam_root = PathBuf::from(steam_root);
+        log::trace!("[Datamine]   Steam root: {:?}", steam_root);
+        
+        // The Steam root is always a library, even if libraryfolders.vdf is missing
+        let mut libraries = vec![steam_root.clone()];
+        let vdf_path = steam_root.join("steamapps").join("libraryfolders.vdf");
+        match std::fs::read_to_string(&vdf_path) {
+            Ok(content) => libraries.extend(parse_steam_library_folders(&content)),
+            Err(e) => log::trace!("[Datamine]   Cannot read {:?}: {}", vdf_path, e),
+        }
+        
+        for library in &libraries {
+            let path = library.join("steamapps").join("common").join("War Thunder");
+            log::trace!("[Datamine]   Trying: {:?}", path);
+            if path.exists() {
+                return Some(path);
+            }
+        }
+        
+        log::trace!("[Datamine]   War Thunder not found in {} Steam libraries", libraries.len());
+        None
+    }
+}
+
+/// Extract library root paths from Steam's libraryfolders.vdf
+/// 
+/// Supports both the current format (`"path" "D:\\SteamLibrary"` inside numbered blocks)
+/// and the legacy one (`"1" "D:\\SteamLibrary"`)
+#[cfg_attr(not(target_os = "windows"), allow(dead_code))]
+fn parse_steam_library_folders(content: &str) -> Vec<PathBuf> {
+    let mut libraries = Vec::new();
+    let mut depth = 0usize;
+    
+    for line in content.lines() {
+        match line.trim() {
+            "{" => { depth += 1; continue; }
+            "}" => { depth = depth.saturating_sub(1); continue; }
+            _ => {}
+        }
+        
+        let tokens = vdf_quoted_tokens(line);
+        if tokens.len() != 2 {
+            continue;
+        }
+        
+        // Legacy entries are numbered keys directly under the root block;
+        // deeper numeric keys are app IDs
+        let key = tokens[0].as_str();
+        let is_legacy_entry = depth == 1 && !key.is_empty() && key.chars().all(|c| c.is_ascii_digit());
+        if key.eq_ignore_ascii_case("path") || is_legacy_entry {
+            libraries.push(PathBuf::from(&tokens[1]));
+        }
+    }
+    
+    libraries
+}
+
+/// Split a VDF line into its quoted strings, resolving backslash escapes
+#[cfg_attr(not(target_os = "windows"), allow(dead_code))]
+fn vdf_quoted_tokens(line: &str) -> Vec<String> {
+    let mut tokens = Vec::new();
+    let mut chars = line.chars();
+    
+    while let Some(c) = chars.next() {
+        if c != '"' {
+            continue;
+        }
+        
+        let mut token = String::new();
+        while let Some(c) = chars.next() {
+            match c {
+                '"' => break,
+                '\\' => {
+                    if let Some(escaped) = chars.next() {
+                        token.push(escaped);
+                    }
+                }
+                _ => token.push(c),
+            }
+        }
+        tokens.push(token);
+    }
+    
+    tokens
 }
 
 /// Statistics from parsing operation
@@ -269,3 +371,52 @@ pub struct ParseStats {
     pub duration_ms: u64,
 }
 
+#[cfg(test)]
+mod tests {
+    use super::*;
+    
+    #[test]
+    fn test_parse_steam_library_folders() {
+        let vdf = r#"
+"libraryfolders"
+{
+	"0"
+	{
+		"path"		"C:\\Program Files (x86)\\Steam"
+		"label"		""
+		"apps"
+		{
+			"236390"		"71271478272"
+		}
+	}
+	"1"
+	{
+		"path"		"D:\\SteamLibrary"
+	}
+}
+"#;
+        assert_eq!(
+            parse_steam_library_folders(vdf),
+            vec![
+                PathBuf::from(r"C:\Program Files (x86)\Steam"),
+                PathBuf::from(r"D:\SteamLibrary"),
+            ]
+        );
+    }
+    
+    #[test]
+    fn test_parse_legacy_steam_library_folders() {
+        let vdf = r#"
+"LibraryFolders"
+{
+	"TimeNextStatsReport"		"1600000000"
+	"ContentStatsID"		"-123"
+	"1"		"E:\\Games\\Steam"
+}
+"#;
+        assert_eq!(
+            parse_steam_library_folders(vdf),
+            vec![PathBuf::from(r"E:\Games\Steam")]
+        );
+    }
+}
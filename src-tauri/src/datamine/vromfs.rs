@@ -6,8 +6,12 @@
 use anyhow::{Result, bail};
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::time::{Duration, Instant};
 use wt_blk::vromf::{VromfUnpacker, BlkOutputFormat};
 
+/// Minimum interval between progress log lines while writing unpacked files
+const PROGRESS_LOG_INTERVAL: Duration = Duration::from_secs(1);
+
 /// Unpack VROMFS archive using wt_blk library
 pub fn unpack_vromfs(vromfs_path: &Path) -> Result<PathBuf> {
     log::info!("[VROMFS] 🔍 Looking for game data...");
@@ -97,10 +101,12 @@ fn unpack_with_wt_blk(vromfs_path: &Path, output_dir: &Path) -> Result<()> {
     // Create output directory
     fs::create_dir_all(output_dir)?;
     
-    // Write files to disk
+    // Write files to disk (progress logged at most once per second)
+    let mut last_progress = Instant::now();
     for (idx, file) in files.iter().enumerate() {
-        if idx % 100 == 0 {
+        if last_progress.elapsed() >= PROGRESS_LOG_INTERVAL {
             log::info!("[VROMFS] Writing: {}/{}", idx + 1, files.len());
+            last_progress = Instant::now();
         }
         
         // Get file path and content using correct API
@@ -145,9 +145,10 @@ pub async fn scrape_aircraft_vehicle(identifier: &str) -> Result<WikiAircraftDat
         };
         
         log::debug!("[Wiki] 📊 Block #{}: '{}'", block_idx + 1, header);
+        let header_lower = header.to_lowercase();
         
         // Parse "G limit" block
-        if header.to_lowercase().contains("g limit") {
+        if header_lower.contains("g limit") {
             if let Some(value_elem) = block.select(&value_selector).next() {
                 let value_text = value_elem.text().collect::<String>().trim().to_string();
                 log::debug!("[Wiki]   Raw G-limit value: '{}'", value_text);
@@ -162,7 +163,7 @@ pub async fn scrape_aircraft_vehicle(identifier: &str) -> Result<WikiAircraftDat
         }
         
         // Parse "Flap Speed Limit (IAS)" block
-        if header.to_lowercase().contains("flap") && header.to_lowercase().contains("speed") {
+        if header_lower.contains("flap") && header_lower.contains("speed") {
             if let Some(value_elem) = block.select(&value_selector).next() {
                 let value_text = value_elem.text().collect::<String>().trim().to_string();
                 log::debug!("[Wiki]   Raw Flap Speed value: '{}'", value_text);
@@ -179,7 +180,7 @@ pub async fn scrape_aircraft_vehicle(identifier: &str) -> Result<WikiAircraftDat
         }
         
         // Parse "Gear Speed Limit (IAS)" block
-        if header.to_lowercase().contains("gear") && header.to_lowercase().contains("speed") {
+        if header_lower.contains("gear") && header_lower.contains("speed") {
             if let Some(value_elem) = block.select(&value_selector).next() {
                 let value_text = value_elem.text().collect::<String>().trim().to_string();
                 log::debug!("[Wiki]   Raw Gear Speed value: '{}'", value_text);